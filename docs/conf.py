@@ -35,7 +35,14 @@ extensions = [
 ]
 
 templates_path = ["_templates"]
-exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
+# tutorial sources are only pulled in with literalinclude, never parsed as documents
+exclude_patterns = [
+    "_build",
+    "Thumbs.db",
+    ".DS_Store",
+    "tutorial/src",
+    "**/__pycache__",
+]
 
 
 pygments_style = "sphinx"
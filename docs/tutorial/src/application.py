@@ -9,6 +9,36 @@ from todos import TodoRepository, todos
 from lato import Application, TransactionContext
 
 
+def on_enter_transaction_context(ctx: TransactionContext):
+    print("Begin transaction")
+    ctx.set_dependencies(
+        now=datetime.now(),
+    )
+
+
+def on_exit_transaction_context(ctx: TransactionContext, exception=None):
+    print("End transaction")
+
+
+def logging_middleware(ctx: TransactionContext, call_next: Callable) -> Any:
+    handler = ctx.current_handler
+    message_name = type(ctx.get_dependency("message")).__name__
+    handler_name = f"{handler.source}.{handler.fn.__name__}"
+    print(f"Executing {handler_name}({message_name})")
+    result = call_next()
+    print(f"Result from {handler_name}: {result}")
+    return result
+
+
+def analytics_middleware(ctx: TransactionContext, call_next: Callable) -> Any:
+    result = call_next()
+    todos_counter = ctx.get_dependency(TodosCounter)
+    print(
+        f" todos stats: {todos_counter.completed_todos}/{todos_counter.created_todos}"
+    )
+    return result
+
+
 def create_app() -> Application:
     # create an application with dependencies used across the handlers
     app = Application(
@@ -22,35 +52,10 @@ def create_app() -> Application:
     app.include_submodule(notifications)
     app.include_submodule(analytics)
 
-    # add transaction context middlewares
-    @app.on_enter_transaction_context
-    def on_enter_transaction_context(ctx: TransactionContext):
-        print("Begin transaction")
-        ctx.set_dependencies(
-            now=datetime.now(),
-        )
-
-    @app.on_exit_transaction_context
-    def on_exit_transaction_context(ctx: TransactionContext, exception=None):
-        print("End transaction")
-
-    @app.transaction_middleware
-    def logging_middleware(ctx: TransactionContext, call_next: Callable) -> Any:
-        handler = ctx.current_handler
-        message_name = ctx.get_dependency("message").__class__.__name__
-        handler_name = f"{handler.source}.{handler.fn.__name__}"
-        print(f"Executing {handler_name}({message_name})")
-        result = call_next()
-        print(f"Result from {handler_name}: {result}")
-        return result
-
-    @app.transaction_middleware
-    def analytics_middleware(ctx: TransactionContext, call_next: Callable) -> Any:
-        result = call_next()
-        todos_counter = ctx.get_dependency(TodosCounter)
-        print(
-            f" todos stats: {todos_counter.completed_todos}/{todos_counter.created_todos}"
-        )
-        return result
+    # add transaction context callbacks and middlewares
+    app.on_enter_transaction_context(on_enter_transaction_context)
+    app.on_exit_transaction_context(on_exit_transaction_context)
+    app.transaction_middleware(logging_middleware)
+    app.transaction_middleware(analytics_middleware)
 
     return app
@@ -39,6 +39,8 @@ class TodoModel:
 class TodoReadModel:
     """Read model exposed to the external world"""
 
+    __slots__ = ("id", "title", "description", "is_due", "is_completed")
+
     id: UUID
     title: str
     description: str
@@ -47,12 +49,13 @@ class TodoReadModel:
 
 
 def todo_model_to_read_model(todo: TodoModel, now: datetime) -> TodoReadModel:
+    is_completed = todo.is_completed
     return TodoReadModel(
         id=todo.id,
         title=todo.title,
         description=todo.description,
-        is_due=todo.is_due(now),
-        is_completed=todo.is_completed,
+        is_due=is_completed and todo.is_due(now),
+        is_completed=is_completed,
     )
 
 
@@ -60,25 +63,36 @@ class TodoRepository:
     """A repository of todos"""
 
     def __init__(self):
-        self.items: list[TodoModel] = []
+        self.items: dict[UUID, TodoModel] = {}
+        self.completed: dict[UUID, TodoModel] = {}
+        self.not_completed: dict[UUID, TodoModel] = {}
 
     def add(self, item: TodoModel) -> None:
-        self.items.append(item)
+        self.items[item.id] = item
+        if item.is_completed:
+            self.completed[item.id] = item
+        else:
+            self.not_completed[item.id] = item
+
+    def mark_as_completed(self, item: TodoModel, when: datetime) -> None:
+        item.mark_as_completed(when)
+        self.not_completed.pop(item.id, None)
+        self.completed[item.id] = item
 
     def get_by_id(self, todo_id: UUID) -> TodoModel:
-        for item in self.items:
-            if item.id == todo_id:
-                return item
-        raise ValueError(f"Todo with id {todo_id} does not exist")
+        try:
+            return self.items[todo_id]
+        except KeyError:
+            raise ValueError(f"Todo with id {todo_id} does not exist")
 
     def get_all(self) -> list[TodoModel]:
-        return self.items
+        return list(self.items.values())
 
     def get_all_completed(self):
-        return [todo for todo in self.items if todo.is_completed]
+        return list(self.completed.values())
 
     def get_all_not_completed(self):
-        return [todo for todo in self.items if not todo.is_completed]
+        return list(self.not_completed.values())
 
 
 @todos.handler(CreateTodo)
@@ -97,7 +111,7 @@ def handle_complete_todo(
     command: CompleteTodo, repo: TodoRepository, ctx: TransactionContext, now: datetime
 ):
     a_todo = repo.get_by_id(command.todo_id)
-    a_todo.mark_as_completed(now)
+    repo.mark_as_completed(a_todo, now)
     ctx.publish(TodoWasCompleted(todo_id=a_todo.id))
 
 
@@ -41,7 +41,7 @@ async def on_exit_transaction_context(ctx: TransactionContext, exception=None):
 
 @app.handler("foo")
 async def handle_foo(x, logger):
-    logger.info(f"Starting foo, x={x}")
+    logger.info("Starting foo, x=%s", x)
     await asyncio.sleep(0.001)
     logger.info("Finished foo")
 
@@ -46,14 +46,10 @@ def on_exit_transaction_context(ctx: TransactionContext, exception=None):
 @app.transaction_middleware
 def logging_middleware(ctx: TransactionContext, call_next):
     logger = ctx[logging.Logger]
-    description = (
-        f"{ctx.current_action[1]} -> {repr(ctx.current_action[0])}"
-        if ctx.current_action
-        else ""
-    )
-    logger.debug(f"Executing {description}...")
+    message, handler = ctx.current_action
+    logger.debug("Executing %s -> %r...", handler, message)
     result = call_next()
-    logger.debug(f"Finished executing {description}")
+    logger.debug("Finished executing %s -> %r", handler, message)
     return result
 
 
@@ -8,18 +8,22 @@ project_module = ApplicationModule("project")
 
 @project_module.handler(EmployeeFired)
 def on_employee_fired(event: EmployeeFired, logger):
-    logger.info(f"Checking if employee {event.employee_id} is assigned to a project")
+    logger.info("Checking if employee %s is assigned to a project", event.employee_id)
 
 
 @project_module.handler(CreateProject)
 def create_project(command: CreateProject, logger):
-    logger.info(f"Creating project {command.project_name} with id {command.project_id}")
+    logger.info(
+        "Creating project %s with id %s", command.project_name, command.project_id
+    )
 
 
 @project_module.handler(AssignEmployeeToProject)
 def assign_employee_to_project(command: AssignEmployeeToProject, publish, logger):
     logger.info(
-        f"Assigning employee {command.employee_id} to project {command.project_id}"
+        "Assigning employee %s to project %s",
+        command.employee_id,
+        command.project_id,
     )
     publish(
         EmployeeAssignedToProject(
@@ -31,5 +35,7 @@ def assign_employee_to_project(command: AssignEmployeeToProject, publish, logger
 @project_module.handler(EmployeeAssignedToProject)
 def on_employee_assigned_to_project(event: EmployeeAssignedToProject, logger):
     logger.info(
-        f"Sending 'Welcome to project {event.project_id}' email to employee {event.employee_id}"
+        "Sending 'Welcome to project %s' email to employee %s",
+        event.project_id,
+        event.employee_id,
     )
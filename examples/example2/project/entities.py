@@ -1,8 +1,9 @@
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import date
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectMember:
     employee_id: str
     start_date: date
@@ -11,22 +12,35 @@ class ProjectMember:
 
 @dataclass
 class Project:
+    """A project with its members.
+
+    Change ``members`` only through ``add_member``, ``add_members`` and ``remove_member``,
+    so that the member id index used by ``has_member`` stays in sync.
+    """
+
     id: str
     name: str
     members: list[ProjectMember] = field(default_factory=list)
 
+    def __post_init__(self):
+        # plain attribute, not a dataclass field, so it stays out of asdict() and __eq__
+        self._member_ids: set[str] = {m.employee_id for m in self.members}
+
     def has_member(self, employee_id):
-        return any([m.employee_id == employee_id for m in self.members])
+        return employee_id in self._member_ids
 
     def add_member(self, employee_id):
-        membership = ProjectMember(
-            employee_id=employee_id,
-            start_date=date.today(),
-            end_date=None,
+        self.add_members([employee_id])
+
+    def add_members(self, employee_ids: Iterable[str]):
+        employee_ids = list(employee_ids)
+        today = date.today()
+        self.members.extend(
+            ProjectMember(employee_id=employee_id, start_date=today, end_date=None)
+            for employee_id in employee_ids
         )
-        self.members.append(membership)
+        self._member_ids.update(employee_ids)
 
     def remove_member(self, employee_id):
-        for member in self.members[:]:
-            if member.employee_id == employee_id:
-                self.members.remove(member)
+        self.members = [m for m in self.members if m.employee_id != employee_id]
+        self._member_ids.discard(employee_id)
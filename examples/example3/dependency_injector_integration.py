@@ -1,5 +1,3 @@
-import copy
-import inspect
 import uuid
 from typing import Optional
 
@@ -39,62 +37,87 @@ class TransactionContainer(containers.DeclarativeContainer):
     repository = providers.Singleton(Repository, session=session)
 
 
+# name of the attribute holding the provided class, by provider type
+PROVIDED_CLASS_ATTRS = {Factory: "cls", Singleton: "cls", Dependency: "instance_of"}
+
+
 def resolve_provider_by_type(container: Container, cls: type) -> Optional[Provider]:
     def inspect_provider(provider: Provider) -> bool:
-        if isinstance(provider, (Factory, Singleton)):
-            return issubclass(provider.cls, cls)
-        elif isinstance(provider, Dependency):
-            return issubclass(provider.instance_of, cls)
-
+        for provider_type in type(provider).__mro__:
+            attr = PROVIDED_CLASS_ATTRS.get(provider_type)
+            if attr is not None:
+                return issubclass(getattr(provider, attr), cls)
         return False
 
-    matching_providers = inspect.getmembers(
-        container,
-        inspect_provider,
-    )
+    matching_providers = [
+        provider
+        for provider in container.providers.values()
+        if inspect_provider(provider)
+    ]
     if matching_providers:
         if len(matching_providers) > 1:
             raise ValueError(
-                f"Cannot uniquely resolve {cls}. Found {len(providers)} matching providers."
+                f"Cannot uniquely resolve {cls}. Found {len(matching_providers)} matching providers."
             )
-        return matching_providers[0][1]
+        return matching_providers[0]
     return None
 
 
 class ContainerProvider(DependencyProvider):
     def __init__(self, container: Container):
         self.container = container
-        self.counter = 0
+        self._overrides: dict = {}
+        self._providers_by_type: dict[type, Optional[Provider]] = {}
+        # providers of the container the cache was built for
+        self._cached_providers: tuple[Provider, ...] = ()
+
+    def _get_provider_by_type(self, cls: type) -> Optional[Provider]:
+        providers = tuple(self.container.providers.values())
+        if providers != self._cached_providers:
+            # providers were added, replaced or removed, so cached results may be stale
+            self._providers_by_type = {}
+            self._cached_providers = providers
+        try:
+            return self._providers_by_type[cls]
+        except KeyError:
+            provider = resolve_provider_by_type(self.container, cls)
+            self._providers_by_type[cls] = provider
+            return provider
 
     def has_dependency(self, identifier: str | type) -> bool:
-        if isinstance(identifier, type) and resolve_provider_by_type(
-            self.container, identifier
-        ):
+        if identifier in self._overrides:
             return True
         if type(identifier) is str:
             return identifier in self.container.providers
+        if isinstance(identifier, type):
+            return self._get_provider_by_type(identifier) is not None
+        return False
 
     def register_dependency(self, identifier, dependency_instance):
-        pr = providers.Object(dependency_instance)
-        try:
-            setattr(self.container, identifier, pr)
-        except TypeError:
-            setattr(self.container, f"{str(identifier)}-{self.counter}", pr)
-            self.counter += 1
+        # keep registered instances out of the container, so that they stay
+        # reachable by their original identifier and copies do not share them
+        self._overrides[identifier] = dependency_instance
 
     def get_dependency(self, identifier):
         try:
-            if isinstance(identifier, type):
-                provider = resolve_provider_by_type(self.container, identifier)
-            else:
+            return self._overrides[identifier]
+        except KeyError:
+            pass
+        try:
+            if type(identifier) is str:
                 provider = getattr(self.container, identifier)
+            else:
+                provider = self._get_provider_by_type(identifier)
             instance = provider()
         except Exception as e:
             raise e
         return instance
 
     def copy(self, *args, **kwargs):
-        dp = ContainerProvider(copy.copy(self.container))
+        dp = ContainerProvider(self.container)
+        dp._overrides = self._overrides.copy()
+        dp._providers_by_type = self._providers_by_type
+        dp._cached_providers = self._cached_providers
         dp.update(*args, **kwargs)
         return dp
 
@@ -111,6 +134,12 @@ dp2 = dp1.copy()
 assert dp1["name"] == dp2["name"] == "Foo"
 assert dp1["engine"] is dp2["engine"]
 
+# make sure that providers added to the container later are found by type
+dp4 = ContainerProvider(ApplicationContainer())
+assert not dp4.has_dependency(Session)
+dp4.container.set_provider("session", providers.Factory(Session))
+assert dp4.has_dependency(Session) and dp4.copy().has_dependency(Session)
+
 # create a copy with overriden value
 dp3 = dp1.copy(name="Bar")
 
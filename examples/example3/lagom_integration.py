@@ -46,7 +46,8 @@ class LagomDependencyProvider(DependencyProvider):
     def has_dependency(self, identifier: str | type) -> bool:
         if type(identifier) is str:
             return False
-        return identifier in self.container.defined_types
+        # defined_types builds a new set on every access, get_definition is a lookup
+        return self.container.get_definition(identifier) is not None
 
     def register_dependency(self, identifier, dependency):
         if type(identifier) is str:
@@ -20,19 +20,19 @@ class Repository(Protocol):
 
 class InMemoryRepository(Repository):
     def __init__(self):
-        self.entities = []
+        self.entities: dict[Any, Any] = {}
 
     def add(self, entity: Any):
-        self.entities.append(entity)
+        self.entities[entity.id] = entity
 
     def get_all(self, predicate) -> list[Any]:
-        return [entity for entity in self.entities if predicate(entity)]
+        return [entity for entity in self.entities.values() if predicate(entity)]
 
     def find_by_id(self, entity_id) -> Optional[Any]:
-        return next(entity for entity in self.entities if entity.id == entity_id)
+        return self.entities.get(entity_id)
 
     def find_by(self, predicate):
-        return next(entity for entity in self.entities if predicate(entity))
+        return next(entity for entity in self.entities.values() if predicate(entity))
 
     def delete(self, entity_id):
-        self.entities = [entity for entity in self.entities if entity.id != entity_id]
+        self.entities.pop(entity_id, None)
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from commands import AddItemToCart, RemoveItemFromCart, UpdateItemPrice
 from pydantic import BaseModel, Field
 from repository import Repository
@@ -25,33 +27,27 @@ class CartItem(BaseModel):
 
 class Cart(BaseModel):
     id: CartId
-    items: set[CartItem] = Field(default_factory=set)
+    items: dict[ItemId, CartItem] = Field(default_factory=dict)
 
-    def get_item(self, item_id: ItemId):
-        for item in self.items:
-            if item.item_id == item_id:
-                return item
-        return CartItem(item_id=item_id, quantity=0, current_price=0, last_price=0)
+    def get_item(self, item_id: ItemId) -> Optional[CartItem]:
+        return self.items.get(item_id)
 
     def add_item(self, item_id: ItemId, quantity: Quantity, price: Money):
-        current = self.get_item(item_id)
-        updated = CartItem(
+        current = self.items.get(item_id)
+        self.items[item_id] = CartItem(
             item_id=item_id,
-            quantity=current.quantity + quantity,
+            quantity=(current.quantity if current else 0) + quantity,
             current_price=price,
             last_price=price,
         )
-        self.items.remove(current)
-        self.items.add(updated)
 
     def remove_item(self, item_id: ItemId, quantity: Quantity):
-        for item in self.items:
-            if item.item_id == item_id:
-                item.quantity -= quantity
-                if item.quantity == 0:
-                    self.items.remove(item)
-                return
-        raise ValueError("Item not in cart")
+        item = self.items.get(item_id)
+        if item is None:
+            raise ValueError("Item not in cart")
+        item.quantity -= quantity
+        if item.quantity == 0:
+            del self.items[item_id]
 
 
 class CartRepository(Repository):
@@ -3,7 +3,11 @@ from collections.abc import Awaitable, Callable
 from typing import Any, Optional, Union
 
 from lato.application_module import ApplicationModule
-from lato.dependency_provider import BasicDependencyProvider, DependencyProvider
+from lato.dependency_provider import (
+    BasicDependencyProvider,
+    DependencyProvider,
+    OverlayDependencyProvider,
+)
 from lato.message import Event, Message
 from lato.transaction_context import (
     ComposerFunction,
@@ -54,7 +58,9 @@ class Application(ApplicationModule):
         self._on_exit_transaction_context: Optional[
             OnExitTransactionContextCallback
         ] = None
-        self._transaction_middlewares: list[MiddlewareFunction] = []
+        self._transaction_middlewares: tuple[MiddlewareFunction, ...] = ()
+        # the middlewares in reversed order, in which they wrap the handler
+        self._transaction_middleware_chain: tuple[MiddlewareFunction, ...] = ()
         self._composers: dict[Union[Message, str], ComposerFunction] = {}
 
     def get_dependency(self, identifier: DependencyIdentifier) -> Any:
@@ -152,7 +158,11 @@ class Application(ApplicationModule):
             return result
 
     def emit(self, event: Event) -> dict[MessageHandler, Any]:
-        """Deprecated. Use `publish()` instead."""
+        """Deprecated alias of :meth:`publish`, kept for backward compatibility.
+
+        .. deprecated:: 0.9.0
+            Use :meth:`publish` instead.
+        """
         return self.publish(event)
 
     def publish(self, event: Event) -> dict[MessageHandler, Any]:
@@ -177,6 +187,18 @@ class Application(ApplicationModule):
             result = await ctx.publish_async(event)
         return result
 
+    async def publish_concurrently(self, event: Event) -> dict[MessageHandler, Any]:
+        """
+        Asynchronously publish an event by running all handlers for that event concurrently.
+        If any handler fails, the remaining handlers are cancelled.
+
+        :param event: The event to publish, or an alias of an event handler to call.
+        :return: A dictionary mapping handlers to their results.
+        """
+        async with self.transaction_context() as ctx:
+            result = await ctx.publish_concurrently(event)
+        return result
+
     def on_enter_transaction_context(self, func):
         """
         Decorator for registering a function to be called when entering a transaction context
@@ -265,7 +287,10 @@ class Application(ApplicationModule):
         ...     ...
 
         """
-        self._transaction_middlewares.append(middleware_func)
+        self._transaction_middlewares += (middleware_func,)
+        self._transaction_middleware_chain = (
+            middleware_func,
+        ) + self._transaction_middleware_chain
         return middleware_func
 
     def compose(self, alias):
@@ -305,7 +330,14 @@ class Application(ApplicationModule):
         if self._transaction_context_factory:
             ctx = self._transaction_context_factory(**dependencies)
         else:
-            dp = self.dependency_provider.copy(**dependencies)
+            if type(self.dependency_provider) is BasicDependencyProvider:
+                # layer transaction dependencies over the application ones instead of copying them
+                dp: DependencyProvider = OverlayDependencyProvider(
+                    self.dependency_provider, **dependencies
+                )
+            else:
+                # other providers may build dependencies themselves, so they need a real copy
+                dp = self.dependency_provider.copy(**dependencies)
             ctx = TransactionContext(dependency_provider=dp)
 
         ctx.configure(
@@ -314,5 +346,6 @@ class Application(ApplicationModule):
             middlewares=self._transaction_middlewares,
             composers=self._composers,
             handlers_iterator=self.iterate_handlers_for,
+            middleware_chain=self._transaction_middleware_chain,
         )
         return ctx
@@ -1,6 +1,7 @@
 import logging
 from collections import defaultdict
 from collections.abc import Callable
+from weakref import WeakSet
 
 from lato.message import Message
 from lato.transaction_context import MessageHandler
@@ -21,6 +22,9 @@ class ApplicationModule:
             OrderedSet
         )
         self._submodules: OrderedSet[ApplicationModule] = OrderedSet()
+        # weak, so that including a shared submodule does not keep the including module alive
+        self._parents: WeakSet[ApplicationModule] = WeakSet()
+        self._handler_index: dict[HandlerAlias, tuple[MessageHandler, ...]] = {}
 
     @property
     def identifier(self):
@@ -35,6 +39,8 @@ class ApplicationModule:
             a_module, ApplicationModule
         ), f"Can only include {ApplicationModule} instances, got {a_module}"
         self._submodules.add(a_module)
+        a_module._parents.add(self)
+        self._invalidate_handler_index()
 
     def handler(self, alias: HandlerAlias) -> Callable:
         """
@@ -81,8 +87,11 @@ class ApplicationModule:
             # decorator was called without any argument
             func = alias
             alias = func.__name__
-            assert len(self._handlers[alias]) == 0
+            assert (
+                alias not in self._handlers
+            ), f"Handler for {alias} is already registered in {self.name}"
             self._handlers[alias].add(func)
+            self._invalidate_handler_index()
             return func
 
         # decorator was called with argument
@@ -93,19 +102,34 @@ class ApplicationModule:
             Decorator for registering tasks by name
             """
             self._handlers[alias].add(func)
+            self._invalidate_handler_index()
             return func
 
         return decorator
 
-    def iterate_handlers_for(self, alias: str):
-        if alias in self._handlers:
-            for handler in self._handlers[alias]:
+    def _invalidate_handler_index(self):
+        """Drops the cached handlers of this module and of all modules that include it."""
+        self._handler_index.clear()
+        for parent in self._parents:
+            parent._invalidate_handler_index()
+
+    def _collect_handlers_for(self, alias: HandlerAlias):
+        handlers = self._handlers.get(alias)
+        if handlers:
+            for handler in handlers:
                 yield MessageHandler(source=self.identifier, message=alias, fn=handler)
         for submodule in self._submodules:
-            try:
-                yield from submodule.iterate_handlers_for(alias)
-            except KeyError:
-                pass
+            yield from submodule._collect_handlers_for(alias)
+
+    def iterate_handlers_for(self, alias: HandlerAlias):
+        try:
+            handlers = self._handler_index[alias]
+        except KeyError:
+            handlers = tuple(self._collect_handlers_for(alias))
+            if handlers:
+                # aliases without handlers are not stored, so arbitrary aliases do not grow the index
+                self._handler_index[alias] = handlers
+        return iter(handlers)
 
     def get_handlers_for(self, alias: str):
         return list(self.iterate_handlers_for(alias))
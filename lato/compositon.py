@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from functools import partial, reduce
 from operator import add, or_
 from typing import Optional
@@ -7,6 +7,15 @@ from mergedeep import Strategy, merge  # type: ignore
 
 additive_merge = partial(merge, strategy=Strategy.TYPESAFE_ADDITIVE)
 
+# operators known to compose values of a given type, other values go through the fallback chain
+operators_by_type: dict[type, list[Callable]] = {
+    set: [or_],
+    frozenset: [or_],
+    list: [add],
+    tuple: [add],
+    str: [add],
+}
+
 
 def compose(compose_operator: Optional[Callable] = None, **kwargs):
     values = tuple(value for module_name, value in kwargs.items() if value is not None)
@@ -20,8 +29,13 @@ def compose(compose_operator: Optional[Callable] = None, **kwargs):
 
     if compose_operator is not None:
         operators = [compose_operator]
-    else:
+    elif type(first) in operators_by_type:
+        operators = operators_by_type[type(first)]
+    elif isinstance(first, Mapping):
         operators = [additive_merge, or_, add]
+    else:
+        # merging is only defined for mappings, skip it for other values
+        operators = [or_, add]
 
     for op in operators:
         try:
@@ -1,13 +1,16 @@
 import inspect
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from lato.types import DependencyIdentifier
-from lato.utils import OrderedDict
 
 
 class TypedDependency:
+    __slots__ = ("value", "a_type")
+
     def __init__(self, value, a_type):
         self.value = value
         self.a_type = a_type
@@ -21,18 +24,47 @@ class UnknownDependencyError(KeyError):
     ...
 
 
-def get_function_parameters(func) -> OrderedDict:
+_empty = inspect.Parameter.empty
+
+
+_function_parameters_cache: "WeakKeyDictionary[Callable, Mapping[str, Any]]" = (
+    WeakKeyDictionary()
+)
+# bound methods are created anew on every attribute access, so they are cached by the underlying function
+_bound_method_parameters_cache: "WeakKeyDictionary[Callable, Mapping[str, Any]]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_function_parameters(func) -> Mapping[str, Any]:
     """
     Retrieve the function's parameters and their annotations.
 
+    The result is cached per function, so the signature of a handler is inspected only once.
+
     :param func: The function to inspect
-    :return: An ordered dictionary of parameter names to their annotations
+    :return: A read-only mapping of parameter names to their annotations, in the order of the signature
     """
+    if inspect.ismethod(func):
+        cache, key = _bound_method_parameters_cache, func.__func__
+    else:
+        cache, key = _function_parameters_cache, func
+    try:
+        return cache[key]
+    except (KeyError, TypeError):
+        pass
+
     handler_signature = inspect.signature(func)
-    kwargs_iterator = iter(handler_signature.parameters.items())
-    parameters = OrderedDict()
-    for name, param in kwargs_iterator:
-        parameters[name] = param.annotation
+    # read-only, as the same mapping is returned to every caller
+    parameters = MappingProxyType(
+        {name: param.annotation for name, param in handler_signature.parameters.items()}
+    )
+
+    try:
+        cache[key] = parameters
+    except TypeError:
+        # func cannot be weakly referenced (i.e. a builtin), so it is not cached
+        pass
     return parameters
 
 
@@ -131,7 +163,7 @@ class DependencyProvider(ABC):
             func_kwargs = {}
 
         func_parameters = get_function_parameters(func)
-        resolved_kwargs = OrderedDict()
+        resolved_kwargs = {}
         arg_idx = 0
         for param_name, param_type in func_parameters.items():
             if arg_idx < len(func_args):
@@ -143,9 +175,7 @@ class DependencyProvider(ABC):
             if param_name in func_kwargs:
                 # use keyword argument given explicitly in func_kwargs
                 resolved_kwargs[param_name] = func_kwargs[param_name]
-            elif param_type != inspect.Parameter.empty and self.has_dependency(
-                param_type
-            ):
+            elif param_type is not _empty and self.has_dependency(param_type):
                 # resolve as dependency by type
                 resolved_kwargs[param_name] = self.get_dependency(param_type)
             elif self.has_dependency(param_name):
@@ -183,9 +213,6 @@ class BasicDependencyProvider(DependencyProvider):
         :param identifier: The name or type to be used as an identifier for the dependency
         :param dependency: The actual dependency
         """
-        if isinstance(identifier, type):
-            self._dependencies[identifier] = dependency
-
         self._dependencies[identifier] = dependency
 
     def has_dependency(self, identifier: DependencyIdentifier) -> bool:
@@ -220,3 +247,67 @@ class BasicDependencyProvider(DependencyProvider):
         dp._dependencies.update(self._dependencies)
         dp.update(*args, **kwargs)
         return dp
+
+
+class OverlayDependencyProvider(DependencyProvider):
+    """
+    A dependency provider that layers its own dependencies on top of a parent provider, without copying it.
+    Dependencies registered in the overlay shadow the ones of the parent, and are never written to the parent.
+    """
+
+    def __init__(self, parent: DependencyProvider, *args, **kwargs):
+        """Initialize the OverlayDependencyProvider.
+
+        :param parent: The provider to resolve dependencies from when they are not found in the overlay
+        :param args: Class instances to be registered by types
+        :param kwargs: Dependencies to be registered by types and with explicit names
+        """
+        self.parent = parent
+        self.allow_names = parent.allow_names
+        self.allow_types = parent.allow_types
+        self._dependencies: dict[DependencyIdentifier, Any] = {}
+        self.update(*args, **kwargs)
+
+    def register_dependency(self, identifier: DependencyIdentifier, dependency: Any):
+        """
+        Register a dependency in the overlay, with a given identifier (name or type).
+
+        :param identifier: The name or type to be used as an identifier for the dependency
+        :param dependency: The actual dependency
+        """
+        self._dependencies[identifier] = dependency
+
+    def has_dependency(self, identifier: DependencyIdentifier) -> bool:
+        """
+        Check if a dependency with the given identifier exists in the overlay or in the parent.
+
+        :param identifier: Identifier for the dependency
+        :return: True if the dependency exists, otherwise False
+        """
+        return identifier in self._dependencies or self.parent.has_dependency(
+            identifier
+        )
+
+    def get_dependency(self, identifier: DependencyIdentifier) -> Any:
+        """
+        Retrieve a dependency from the overlay, falling back to the parent.
+
+        :param identifier: Identifier for the dependency
+        :return: The associated dependency
+        """
+        try:
+            return self._dependencies[identifier]
+        except KeyError:
+            return self.parent.get_dependency(identifier)
+
+    def copy(self, *args, **kwargs) -> DependencyProvider:
+        """
+        Create a copy of the overlay with updated dependencies. The parent is shared, not copied.
+        :param args: typed overrides
+        :param kwargs: named overrides
+        :return: A copy of the dependency provider
+        """
+        dp = OverlayDependencyProvider(self.parent)
+        dp._dependencies.update(self._dependencies)
+        dp.update(*args, **kwargs)
+        return dp
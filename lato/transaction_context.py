@@ -1,7 +1,7 @@
 import asyncio
 import logging
-from collections import OrderedDict
-from collections.abc import Awaitable, Callable, Iterator
+from contextvars import ContextVar
+from collections.abc import Awaitable, Callable, Iterator, Sequence
 from dataclasses import dataclass
 from functools import partial
 from typing import Any, Optional, Union
@@ -38,6 +38,12 @@ ComposerFunction = Callable[..., Callable]
 HandlersIterator = Callable[[HandlerAlias], Iterator[MessageHandler]]
 
 
+# handler run by the current task of TransactionContext.publish_concurrently(), paired with its context
+_concurrent_handler: ContextVar[
+    Optional[tuple["TransactionContext", Optional[MessageHandler]]]
+] = ContextVar("lato_concurrent_handler", default=None)
+
+
 class TransactionContext:
     """Transaction context is a context manager for handler execution.
 
@@ -72,14 +78,17 @@ class TransactionContext:
             dependency_provider or self.dependency_provider_factory(*args, **kwargs)
         )
         self.resolved_kwargs: dict[str, Any] = {}
-        self.current_handler: Optional[MessageHandler] = None
+        self._as_dependency = as_type(self, TransactionContext)
+        self._current_handler: Optional[MessageHandler] = None
         self._on_enter_transaction_context: Optional[
             OnEnterTransactionContextCallback
         ] = None
         self._on_exit_transaction_context: Optional[
             OnExitTransactionContextCallback
         ] = None
-        self._middlewares: list[MiddlewareFunction] = []
+        self._middlewares: Sequence[MiddlewareFunction] = ()
+        self._middleware_chain: tuple[MiddlewareFunction, ...] = ()
+        self._async_middleware: Optional[MiddlewareFunction] = None
         self._composers: dict[HandlerAlias, ComposerFunction] = {}
         self._handlers_iterator: HandlersIterator = lambda alias: iter([])
 
@@ -89,9 +98,10 @@ class TransactionContext:
             OnEnterTransactionContextCallback
         ] = None,
         on_exit_transaction_context: Optional[OnExitTransactionContextCallback] = None,
-        middlewares: Optional[list[MiddlewareFunction]] = None,
+        middlewares: Optional[Sequence[MiddlewareFunction]] = None,
         composers: Optional[dict[HandlerAlias, ComposerFunction]] = None,
         handlers_iterator: Optional[HandlersIterator] = None,
+        middleware_chain: Optional[tuple[MiddlewareFunction, ...]] = None,
     ):
         """Customize the behavior of the transaction context with callbacks, middlewares, and composers.
 
@@ -100,6 +110,7 @@ class TransactionContext:
         :param middlewares: Optional; List of middleware functions to be applied.
         :param composers: Optional; List of composers functions to be applied.
         :param handlers_iterator: Optional; Function to iterate over handlers.
+        :param middleware_chain: Optional; ``middlewares`` in reversed order, if already built by the caller.
         """
         if on_enter_transaction_context:
             self._on_enter_transaction_context = on_enter_transaction_context
@@ -107,6 +118,12 @@ class TransactionContext:
             self._on_exit_transaction_context = on_exit_transaction_context
         if middlewares:
             self._middlewares = middlewares
+            # call_next is wrapped from the innermost middleware outwards
+            self._middleware_chain = middleware_chain or tuple(reversed(middlewares))
+            self._async_middleware = next(
+                (m for m in self._middleware_chain if asyncio.iscoroutinefunction(m)),
+                None,
+            )
         if composers:
             self._composers = composers
         if handlers_iterator:
@@ -154,7 +171,7 @@ class TransactionContext:
             self._on_exit_transaction_context(self, exception)
 
         if exception:
-            log.debug("Ended transaction with exception: {}".format(exception))
+            log.debug("Ended transaction with exception: %s", exception)
         else:
             log.debug("Ended transaction")
 
@@ -172,7 +189,7 @@ class TransactionContext:
                 await result
 
         if exception:
-            log.debug("Ended transaction with exception: {}".format(exception))
+            log.debug("Ended transaction with exception: %s", exception)
         else:
             log.debug("Ended transaction")
 
@@ -190,8 +207,8 @@ class TransactionContext:
             + [asyncio.iscoroutinefunction(self._on_exit_transaction_context)]
         )
 
-    def iterate_handlers_for(self, alias: str):
-        yield from self._handlers_iterator(alias)
+    def iterate_handlers_for(self, alias: HandlerAlias) -> Iterator[MessageHandler]:
+        return iter(self._handlers_iterator(alias))
 
     def __enter__(self):
         self.begin()
@@ -227,22 +244,26 @@ class TransactionContext:
                 f"Using async function ({func}) with {self.__class__.__name__}.call() is not allowed. Use call_async() instead."
             )
 
-        self.dependency_provider.update(ctx=as_type(self, TransactionContext))
+        # registered on every call, as the provider may be shared with other contexts or replaced
+        self.dependency_provider.update(ctx=self._as_dependency)
 
         resolved_kwargs = self.dependency_provider.resolve_func_params(
             func, func_args, func_kwargs
         )
         self.resolved_kwargs.update(resolved_kwargs)
 
-        call_next = partial(func, **resolved_kwargs)
-
-        for m in self._middlewares[::-1]:
+        if self._async_middleware is not None:
             # middleware is async, which is not allowed
-            if asyncio.iscoroutinefunction(m):
-                raise TypeError(
-                    f"Using async middleware ({m}) with {self.__class__.__name__}.call() is not allowed. Use call_async() instead."
-                )
+            raise TypeError(
+                f"Using async middleware ({self._async_middleware}) with {self.__class__.__name__}.call() is not allowed. Use call_async() instead."
+            )
+
+        if not self._middleware_chain:
+            return func(**resolved_kwargs)
 
+        call_next = partial(func, **resolved_kwargs)
+
+        for m in self._middleware_chain:
             call_next = partial(m, self, call_next)
 
         return call_next()
@@ -263,16 +284,22 @@ class TransactionContext:
         :return: The result of the function call.
         """
 
-        self.dependency_provider.update(ctx=as_type(self, TransactionContext))
+        # registered on every call, as the provider may be shared with other contexts or replaced
+        self.dependency_provider.update(ctx=self._as_dependency)
 
         resolved_kwargs = self.dependency_provider.resolve_func_params(
             func, func_args, func_kwargs
         )
         self.resolved_kwargs.update(resolved_kwargs)
 
+        if not self._middleware_chain:
+            if asyncio.iscoroutinefunction(func):
+                return await func(**resolved_kwargs)
+            return func(**resolved_kwargs)
+
         call_next = partial(func, **resolved_kwargs)
 
-        for m in self._middlewares[::-1]:
+        for m in self._middleware_chain:
             if asyncio.iscoroutinefunction(m) and not asyncio.iscoroutinefunction(
                 call_next
             ):
@@ -326,7 +353,11 @@ class TransactionContext:
     def emit(
         self, message: Union[str, Message], *args, **kwargs
     ) -> dict[MessageHandler, Any]:
-        # TODO: mark as obsolete
+        """Deprecated alias of :meth:`publish`, kept for backward compatibility.
+
+        .. deprecated:: 0.9.0
+            Use :meth:`publish` instead.
+        """
         return self.publish(message, *args, **kwargs)
 
     def publish(
@@ -340,13 +371,14 @@ class TransactionContext:
         :param kwargs: Keyword arguments to pass to the handlers.
         :return: A dictionary mapping handlers to their results.
         """
-        message_type = type(message) if isinstance(message, Message) else message
-
         if isinstance(message, Message):
+            message_type: HandlerAlias = type(message)
             args = (message, *args)
+        else:
+            message_type = message
 
-        all_results = OrderedDict()
-        for handler in self._handlers_iterator(message_type):  # type: ignore
+        all_results = {}
+        for handler in self._handlers_iterator(message_type):
             self.set_dependency("message", message)
             # FIXME: push and pop current action instead of setting it
             self.current_handler = handler
@@ -359,20 +391,22 @@ class TransactionContext:
     ) -> dict[MessageHandler, Awaitable[Any]]:
         """
         Asynchronously publish a message by calling all handlers for that message.
+        The handlers are awaited one after another, see :meth:`publish_concurrently`
+        for running them concurrently.
 
         :param message: The message object to publish, or an alias of a handler to call.
         :param args: Positional arguments to pass to the handlers.
         :param kwargs: Keyword arguments to pass to the handlers.
         :return: A dictionary mapping handlers to their results.
         """
-        message_type = type(message) if isinstance(message, Message) else message
-
         if isinstance(message, Message):
+            message_type: HandlerAlias = type(message)
             args = (message, *args)
+        else:
+            message_type = message
 
-        all_results = OrderedDict()
-        # TODO: use asyncio.gather()
-        for handler in self._handlers_iterator(message_type):  # type: ignore
+        all_results = {}
+        for handler in self._handlers_iterator(message_type):
             self.set_dependency("message", message)
             # FIXME: push and pop current action instead of setting it
             self.current_handler = (
@@ -382,6 +416,50 @@ class TransactionContext:
             all_results[handler] = result
         return all_results
 
+    async def publish_concurrently(
+        self, message: Union[str, Message], *args, **kwargs
+    ) -> dict[MessageHandler, Any]:
+        """
+        Asynchronously publish a message by running all handlers for that message concurrently.
+        If any handler fails, the remaining handlers are cancelled and awaited before the
+        exception is propagated.
+
+        :param message: The message object to publish, or an alias of a handler to call.
+        :param args: Positional arguments to pass to the handlers.
+        :param kwargs: Keyword arguments to pass to the handlers.
+        :return: A dictionary mapping handlers to their results.
+        """
+        if isinstance(message, Message):
+            message_type: HandlerAlias = type(message)
+            args = (message, *args)
+        else:
+            message_type = message
+
+        handlers = list(self._handlers_iterator(message_type))
+        self.set_dependency("message", message)
+        tasks = [
+            asyncio.ensure_future(
+                self._call_handler_concurrently(handler, *args, **kwargs)
+            )
+            for handler in handlers
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # do not leave sibling handlers running after the transaction ends
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return dict(zip(handlers, results))
+
+    async def _call_handler_concurrently(
+        self, handler: MessageHandler, *args, **kwargs
+    ) -> Any:
+        # each task runs in a copy of the context, so the handler set here is local to the task
+        _concurrent_handler.set((self, handler))
+        return await self.call_async(handler.fn, *args, **kwargs)
+
     def get_dependency(self, identifier: Any) -> Any:
         """Gets a dependency from the dependency provider"""
         return self.dependency_provider.get_dependency(identifier)
@@ -401,13 +479,35 @@ class TransactionContext:
     def _compose_results(
         self, message: Message, results: dict[MessageHandler, Any]
     ) -> Any:
-        alias = message.__class__  # TODO: expose alias as static field in Message class
-        composer = self._composers.get(alias, compose)
+        # TODO: expose alias as static field in Message class
+        composer = (
+            self._composers.get(type(message), compose) if self._composers else compose
+        )
+        if composer is compose and len(results) == 1:
+            # a single result is returned as is by the default composer
+            return next(iter(results.values()))
         # TODO: there may be multiple values for one source, it this case we should raise an exception and
         # instruct developer to implement a composer on a source level
         kwargs = {k.source: v for k, v in results.items()}
         return composer(**kwargs)
 
+    @property
+    def current_handler(self) -> Optional[MessageHandler]:
+        """Returns the handler being executed"""
+        concurrent = _concurrent_handler.get()
+        if concurrent is not None and concurrent[0] is self:
+            return concurrent[1]
+        return self._current_handler
+
+    @current_handler.setter
+    def current_handler(self, handler: Optional[MessageHandler]) -> None:
+        concurrent = _concurrent_handler.get()
+        if concurrent is not None and concurrent[0] is self:
+            # only visible to the task running this handler
+            _concurrent_handler.set((self, handler))
+        else:
+            self._current_handler = handler
+
     @property
     def current_action(self) -> tuple[Message, Callable]:
         """Returns current message and handler being executed"""
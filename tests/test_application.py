@@ -1,6 +1,12 @@
 import pytest
 
-from lato import Application, Command, Event, TransactionContext
+from lato import (
+    Application,
+    BasicDependencyProvider,
+    Command,
+    Event,
+    TransactionContext,
+)
 
 
 class FooService:
@@ -30,6 +36,31 @@ def test_app_transaction_context_with_kwargs():
     assert ctx.dependency_provider["x"] == 1
 
 
+def test_app_transaction_context_copies_custom_provider():
+    class CustomDependencyProvider(BasicDependencyProvider):
+        copies = 0
+
+        def copy(self, *args, **kwargs):
+            CustomDependencyProvider.copies += 1
+            return super().copy(*args, **kwargs)
+
+    app = Application(dependency_provider=CustomDependencyProvider(x=1))
+    ctx = app.transaction_context(y=2)
+
+    assert CustomDependencyProvider.copies == 1
+    assert ctx["x"] == 1 and ctx["y"] == 2
+
+
+def test_app_transaction_context_does_not_leak_dependencies():
+    app = Application(x=1)
+    ctx = app.transaction_context(y=2)
+    ctx.set_dependency("x", 10)
+
+    assert ctx["x"] == 10 and ctx["y"] == 2
+    assert app["x"] == 1
+    assert not app.dependency_provider.has_dependency("y")
+
+
 def test_app_enter_exit_transaction_context():
     app = Application()
 
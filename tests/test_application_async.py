@@ -3,7 +3,7 @@ from collections.abc import Callable
 
 import pytest
 
-from lato import Application, Command, TransactionContext
+from lato import Application, Command, Event, TransactionContext
 
 
 @pytest.mark.asyncio
@@ -149,6 +149,96 @@ async def test_execute_async_command_handler_with_async_context():
     ]
 
 
+@pytest.mark.asyncio
+async def test_publish_concurrently_runs_handlers_concurrently():
+    app = Application()
+    second_started = asyncio.Event()
+
+    class FooEvent(Event):
+        ...
+
+    @app.handler(FooEvent)
+    async def first_handler(event: FooEvent):
+        # would wait forever if the handlers were awaited one after another
+        await second_started.wait()
+        return "first"
+
+    @app.handler(FooEvent)
+    async def second_handler(event: FooEvent):
+        second_started.set()
+        return "second"
+
+    results = await app.publish_concurrently(FooEvent())
+
+    assert list(results.values()) == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_publish_concurrently_sets_current_handler_for_middlewares():
+    seen = []
+    app = Application()
+    second_started = asyncio.Event()
+
+    class FooEvent(Event):
+        ...
+
+    @app.transaction_middleware
+    async def middleware(ctx: TransactionContext, call_next: Callable):
+        before = ctx.current_handler.fn.__name__
+        result = await call_next()
+        seen.append((before, ctx.current_handler.fn.__name__))
+        return result
+
+    @app.handler(FooEvent)
+    async def first_handler(event: FooEvent):
+        await second_started.wait()
+
+    @app.handler(FooEvent)
+    async def second_handler(event: FooEvent):
+        second_started.set()
+
+    await app.publish_concurrently(FooEvent())
+
+    assert seen == [
+        ("second_handler", "second_handler"),
+        ("first_handler", "first_handler"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_publish_concurrently_cancels_other_handlers_on_error():
+    trace = []
+    app = Application()
+    waiting = asyncio.Event()
+    never_set = asyncio.Event()
+
+    class FooEvent(Event):
+        ...
+
+    @app.handler(FooEvent)
+    async def waiting_handler(event: FooEvent):
+        waiting.set()
+        try:
+            await never_set.wait()
+        except asyncio.CancelledError:
+            trace.append("cancelled")
+            raise
+
+    @app.handler(FooEvent)
+    async def failing_handler(event: FooEvent):
+        await waiting.wait()
+        raise ValueError()
+
+    @app.on_exit_transaction_context
+    def on_exit(ctx, exception=None):
+        trace.append("exit")
+
+    with pytest.raises(ValueError):
+        await app.publish_concurrently(FooEvent())
+
+    assert trace == ["cancelled", "exit"]
+
+
 @pytest.mark.asyncio
 async def test_call_async_handler_with_sync_context():
     trace = []
@@ -193,3 +283,24 @@ async def test_call_async_handler_with_sync_middleware():
     with pytest.raises(TypeError):
         # cannot use synchronous middleware with async handler
         await app.call_async("async_foo")
+
+
+@pytest.mark.asyncio
+async def test_publish_async_without_handlers_runs_transaction_context_callbacks():
+    trace = []
+    app = Application()
+
+    class UnhandledEvent(Event):
+        ...
+
+    @app.on_enter_transaction_context
+    async def on_enter_transaction_context(ctx: TransactionContext):
+        trace.append("enter")
+
+    @app.on_exit_transaction_context
+    async def on_exit_transaction_context(ctx: TransactionContext, exception=None):
+        trace.append("exit")
+
+    assert await app.publish_async(UnhandledEvent()) == {}
+    assert await app.publish_concurrently(UnhandledEvent()) == {}
+    assert trace == ["enter", "exit", "enter", "exit"]
@@ -38,6 +38,14 @@ def test_compose_nones():
     assert compose(a=None, b=None) is None
 
 
+def test_compose_non_mappings():
+    assert compose(a={1}, b={2}) == {1, 2}
+    assert compose(a=[1], b=[2]) == [1, 2]
+    assert compose(a=(1,), b=(2,)) == (1, 2)
+    assert compose(a="foo", b="bar") == "foobar"
+    assert compose(a=1.5, b=2) == 3.5
+
+
 def test_message_composition():
     class SampleCommand(Command):
         ...
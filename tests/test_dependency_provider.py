@@ -1,7 +1,10 @@
 import abc
 
+import pytest
+
 from lato.dependency_provider import (
     BasicDependencyProvider,
+    OverlayDependencyProvider,
     as_type,
     get_function_parameters,
 )
@@ -64,6 +67,33 @@ def test_get_function_parameters():
     assert params["c"] == FooService
 
 
+def test_get_function_parameters_is_cached():
+    assert get_function_parameters(foo) is get_function_parameters(foo)
+
+
+def test_get_function_parameters_is_read_only():
+    params = get_function_parameters(foo)
+    with pytest.raises(TypeError):
+        params["a"] = str  # type: ignore[index]
+    assert get_function_parameters(foo)["a"] == int
+
+
+def test_get_function_parameters_of_bound_method_is_cached():
+    class Handler:
+        def handle(self, a: int, service: FooService):
+            ...
+
+    handler = Handler()
+    params = get_function_parameters(handler.handle)
+    assert list(params) == ["a", "service"]
+    assert get_function_parameters(handler.handle) is params
+
+
+def test_get_function_parameters_of_builtin():
+    params = get_function_parameters(divmod)
+    assert list(params) == ["x", "y"]
+
+
 def test_resolve_params_when_empty():
     dp = BasicDependencyProvider()
     assert dp.resolve_func_params(foo) == {}
@@ -138,3 +168,34 @@ def test_update_kwarg_dependency_as_type():
 
     assert dp[FooService] is service
     assert dp["service"] is service
+
+
+def test_overlay_resolves_from_parent():
+    service = FooService()
+    parent = BasicDependencyProvider(service=service)
+    dp = OverlayDependencyProvider(parent, x=1)
+    assert dp[FooService] is service
+    assert dp["x"] == 1
+
+
+def test_overlay_does_not_modify_parent():
+    service1 = FooService()
+    service2 = FooService()
+    parent = BasicDependencyProvider(service=service1)
+    dp = OverlayDependencyProvider(parent)
+
+    dp.update(service=service2)
+
+    assert dp["service"] is service2
+    assert parent["service"] is service1
+    assert not parent.has_dependency("x")
+
+
+def test_overlay_copy_keeps_overlay_dependencies():
+    parent = BasicDependencyProvider(x=1)
+    dp = OverlayDependencyProvider(parent, y=2)
+
+    dp_copy = dp.copy(z=3)
+
+    assert dp_copy["x"] == 1 and dp_copy["y"] == 2 and dp_copy["z"] == 3
+    assert not dp.has_dependency("z")
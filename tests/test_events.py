@@ -41,3 +41,32 @@ def test_emit_events():
 
     assert len(app.get_handlers_for(SampleEvent)) == 3
     assert buffer == ["a", "b", "c"]
+
+
+def test_publish_without_handlers_runs_transaction_context_callbacks():
+    class UnhandledEvent(Event):
+        ...
+
+    buffer = []
+    app = create_app(buffer=buffer)
+
+    @app.on_enter_transaction_context
+    def on_enter_transaction_context(ctx):
+        buffer.append("enter")
+
+    @app.on_exit_transaction_context
+    def on_exit_transaction_context(ctx, exception=None):
+        buffer.append("exit")
+
+    assert app.publish(UnhandledEvent()) == {}
+    assert buffer == ["enter", "exit"]
+
+
+def test_emit_uses_overridden_publish():
+    class MyApplication(Application):
+        def publish(self, event):
+            return "overridden"
+
+    app = MyApplication()
+
+    assert app.emit(Event()) == "overridden"
@@ -1,3 +1,8 @@
+import gc
+import weakref
+
+from lato import Application, ApplicationModule
+
 from .modular_application import create_app
 from .modular_application.employee_module import add_candidate
 
@@ -26,6 +31,35 @@ def test_get_multiple_handlers():
     assert len(employee_fired_handlers) == 2
 
 
+def test_handlers_registered_after_include_are_found():
+    app = Application()
+    parent = ApplicationModule("parent")
+    child = ApplicationModule("child")
+    parent.include_submodule(child)
+    app.include_submodule(parent)
+    assert list(app.iterate_handlers_for("foo")) == []
+
+    @child.handler("foo")
+    def foo():
+        return "foo"
+
+    assert [h.fn for h in app.iterate_handlers_for("foo")] == [foo]
+    assert app.call("foo") == "foo"
+
+
+def test_included_submodule_does_not_keep_parent_alive():
+    shared = ApplicationModule("shared")
+    app = Application()
+    app.include_submodule(shared)
+    app_ref = weakref.ref(app)
+
+    del app
+    gc.collect()
+
+    assert app_ref() is None
+    assert len(shared._parents) == 0
+
+
 def test_modular_application_call_by_alias():
     app = create_app()
     app.call("add_candidate", 1, "Alice")
@@ -46,3 +80,12 @@ def test_modular_application_emit_events():
         "Sending exit email to 1",
         "Committing transaction",
     ]
+
+
+def test_handler_index_does_not_store_unhandled_aliases():
+    app = Application()
+
+    for i in range(10):
+        app.publish(f"unhandled_{i}")
+
+    assert app._handler_index == {}